@@ -232,19 +232,22 @@ export class DashboardApp {
      */
     _updateRepoHistory(repos) {
         for (const repo of repos) {
-            const key = this._getRepoKey(repo);
             const successRate = repo.recent_success_rate;
 
-            // Skip if success rate is null, undefined, or not a number
-            if (successRate == null || typeof successRate !== 'number' || !Number.isFinite(successRate)) {
+            // Skip if success rate is null, undefined, not a number, NaN or infinite
+            if (!Number.isFinite(successRate)) {
                 continue;
             }
 
-            // Get or create history array for this repo
-            if (!this.repoHistory.has(key)) {
-                this.repoHistory.set(key, []);
+            // Resolve the key only for rows that will be recorded
+            const key = this._getRepoKey(repo);
+
+            // Get or create history array for this repo (one lookup when present)
+            let history = this.repoHistory.get(key);
+            if (history === undefined) {
+                history = [];
+                this.repoHistory.set(key, history);
             }
-            const history = this.repoHistory.get(key);
 
             // Append new value
             history.push(successRate);
@@ -280,8 +283,6 @@ export class DashboardApp {
      */
     _updateServiceHistory(services) {
         for (const service of services) {
-            const key = this._getServiceKey(service);
-            
             // Prefer server-provided samples if available
             // This enables sparklines to persist across browser refreshes
             if (service.latency_samples_ms && Array.isArray(service.latency_samples_ms)) {
@@ -291,7 +292,7 @@ export class DashboardApp {
                     v => typeof v === 'number' && Number.isFinite(v) && v >= 0
                 );
                 if (validSamples.length > 0) {
-                    this.serviceHistory.set(key, validSamples);
+                    this.serviceHistory.set(this._getServiceKey(service), validSamples);
                     continue;
                 }
             }
@@ -299,16 +300,20 @@ export class DashboardApp {
             // Fallback: client-side tracking (original behavior)
             const latency = service.latency_ms;
 
-            // Skip if latency is null, undefined, or not a number
-            if (latency == null || typeof latency !== 'number' || !Number.isFinite(latency)) {
+            // Skip if latency is null, undefined, not a number, NaN or infinite
+            if (!Number.isFinite(latency)) {
                 continue;
             }
 
-            // Get or create history array for this service
-            if (!this.serviceHistory.has(key)) {
-                this.serviceHistory.set(key, []);
+            // Resolve the key only for services that will be recorded
+            const key = this._getServiceKey(service);
+
+            // Get or create history array for this service (one lookup when present)
+            let history = this.serviceHistory.get(key);
+            if (history === undefined) {
+                history = [];
+                this.serviceHistory.set(key, history);
             }
-            const history = this.serviceHistory.get(key);
 
             // Append new value
             history.push(latency);
@@ -0,0 +1,338 @@
+"""Shared helpers for running frontend ES modules under Node.js in tests."""
+import atexit
+import functools
+import json
+import os
+import selectors
+import shutil
+import stat
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Command prefix for running Node.js scripts; scripts for run_module are read
+# from stdin as an ES module, and the worker appends its runner path. The
+# executable is resolved on PATH once at import rather than on every spawn.
+NODE_COMMAND = (shutil.which('node') or 'node', '--no-warnings')
+MODULE_FROM_STDIN = ('--input-type=module',)
+
+# Seconds to wait for Node.js output before treating a script or worker
+# call as hung.
+NODE_TIMEOUT = 30
+
+
+def _private_compile_cache_dir():
+    """Return this user's compile cache directory, or None if it is not private.
+
+    The directory lives in the shared temp dir, so one created by another
+    user (or opened up to others) is never used.
+    """
+    if not hasattr(os, 'getuid'):
+        return None  # no POSIX ownership to check, so no shared-dir cache
+    path = Path(tempfile.gettempdir()) / f'dso-dashboard-node-compile-cache-{os.getuid()}'
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        info = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _node_env():
+    """Return the environment for Node.js processes, built on the first spawn.
+
+    Node.js 22.1+ caches compiled frontend modules on disk between runs when
+    NODE_COMPILE_CACHE is set; older versions ignore the variable. A cache
+    directory chosen by the caller's environment is left alone.
+    """
+    env = dict(os.environ)
+    if 'NODE_COMPILE_CACHE' not in env:
+        cache_dir = _private_compile_cache_dir()
+        if cache_dir is not None:
+            env['NODE_COMPILE_CACHE'] = str(cache_dir)
+    return env
+
+# Persistent worker script that preloads frontend modules (see NodeWorker).
+RUNNER_PATH = Path(__file__).with_name('_node_runner.mjs')
+
+
+def run_module(script):
+    """Run an ES module script with Node.js and return its parsed JSON stdout.
+
+    The script is piped to Node.js on stdin, so no file is written and no
+    shell is involved; imports must use absolute ``file://`` URLs.
+    """
+    command = [*NODE_COMMAND, *MODULE_FROM_STDIN]
+    source = script.encode('utf-8')
+    # Fast path: only stdout is piped; stderr is collected on failure below.
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_node_env(),
+    ) as process:
+        try:
+            # Kept as bytes: json.loads detects the UTF-8 encoding itself.
+            stdout, _ = process.communicate(source, timeout=NODE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise AssertionError(f"Node.js script timed out after {NODE_TIMEOUT}s") from None
+        returncode = process.returncode
+
+    if returncode:
+        # Re-run with stderr captured to provide clearer diagnostics when
+        # Node.js fails (e.g., syntax/import errors).
+        failed = subprocess.run(
+            command,
+            input=script,
+            capture_output=True,
+            text=True,
+            env=_node_env(),
+            timeout=NODE_TIMEOUT,
+        )
+        message_parts = [
+            "Node.js script failed",
+            f"Return code: {returncode}",
+        ]
+        if failed.stdout:
+            message_parts.append("STDOUT:\n" + failed.stdout)
+        if failed.stderr:
+            message_parts.append("STDERR:\n" + failed.stderr)
+        raise AssertionError("\n".join(message_parts))
+
+    stdout = stdout.strip()
+    if not stdout:
+        raise AssertionError("Node.js script produced no output on stdout to parse as JSON")
+
+    try:
+        return json.loads(stdout)
+    except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError on bad bytes
+        # Include the raw stdout to help debug malformed JSON or extra logging.
+        raise AssertionError(
+            f"Failed to parse JSON from Node.js stdout: {e}\n"
+            f"Raw stdout:\n{stdout.decode('utf-8', errors='replace')}"
+        ) from e
+
+
+class NodeWorker:
+    """Long-lived Node.js process that calls into preloaded frontend modules.
+
+    Modules are registered by short key in ``_node_runner.mjs`` so each call
+    is a single JSON line round-trip instead of a fresh Node.js startup.
+    Requests carry an id that the runner echoes back, so callers can
+    ``submit`` several requests before ``reap``-ing their responses.
+    stderr is inherited rather than piped: JS failures come back as
+    ``error`` responses, and startup crashes print straight to the console.
+    A worker that times out or exits is killed and discarded, so the next
+    ``get_worker()`` starts a fresh one instead of waiting on it again.
+
+    POSIX-only: the pipes are polled with ``selectors`` and non-blocking
+    writes, which Windows supports only for sockets.
+    """
+
+    def __init__(self):
+        self._process = subprocess.Popen(
+            [*NODE_COMMAND, str(RUNNER_PATH)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,
+            env=_node_env(),
+        )
+        self._stdin_fd = self._process.stdin.fileno()
+        self._stdout_fd = self._process.stdout.fileno()
+        os.set_blocking(self._stdin_fd, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._stdout_fd, selectors.EVENT_READ)
+        self._buffer = bytearray()
+        self._pending = {}
+        self._responses = {}
+        self._next_id = 0
+
+    def call(self, ns, fn, *args):
+        """Call ``fn`` from the module registered as ``ns`` and return its result."""
+        return self.reap(self.submit(ns, fn, *args))['result']
+
+    def call_batch(self, ns, fn, args_by_key):
+        """Call ``fn`` once per argument tuple as one pipelined batch.
+
+        ``args_by_key`` maps a caller-chosen key to the positional arguments
+        for that call; returns ``{key: result}``.
+        """
+        return self.call_many({key: (ns, fn, *args) for key, args in args_by_key.items()})
+
+    def call_many(self, calls_by_key):
+        """Make several calls, possibly to different functions, as one pipelined batch.
+
+        ``calls_by_key`` maps a caller-chosen key to an ``(ns, fn, *args)``
+        tuple; returns ``{key: result}``. Every response is reaped before the
+        first failing call's error is raised, so a failure leaves nothing
+        queued for later callers.
+        """
+        request_ids = {key: self.submit(*call) for key, call in calls_by_key.items()}
+        results = {}
+        first_error = None
+        for key, request_id in request_ids.items():
+            try:
+                results[key] = self.reap(request_id)['result']
+            except AssertionError as e:
+                if self._process.returncode is not None:
+                    raise  # worker was discarded; nothing left to reap
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def render(self, ns, fn, *args, dom):
+        """Call a DOM-rendering ``fn`` against a fresh mock document.
+
+        ``dom`` maps element ids to their initial CSS classes; ids not listed
+        resolve to null. Returns the post-call state of each element as
+        ``{id: {'classes': [...], 'children': [{'className', 'textContent'}]}}``.
+        """
+        return self.reap(self.submit(ns, fn, *args, dom=dom))['dom']
+
+    def call_with_storage(self, ns, fn, *args, storage):
+        """Call ``fn`` against a fresh mock localStorage seeded from ``storage``.
+
+        Returns ``(result, entries)`` where ``entries`` holds the stored
+        key/value pairs after the call.
+        """
+        response = self.reap(self.submit(ns, fn, *args, storage=storage))
+        return response['result'], response['storage']
+
+    def submit(self, ns, fn, *args, dom=None, storage=None):
+        """Send a request without waiting for it; returns the id to ``reap``."""
+        self._next_id += 1
+        request = {'id': self._next_id, 'ns': ns, 'fn': fn, 'args': list(args)}
+        if dom is not None:
+            request['dom'] = dom
+        if storage is not None:
+            request['storage'] = storage
+        self._pending[self._next_id] = f"{ns}.{fn}"
+        self._write((json.dumps(request, separators=(',', ':')) + '\n').encode('utf-8'))
+        return self._next_id
+
+    def reap(self, request_id):
+        """Wait for the response to a submitted request and return it."""
+        while request_id not in self._responses:
+            if not self._selector.select(NODE_TIMEOUT):
+                self._abort(f"Node.js call {self._pending[request_id]} timed out after {NODE_TIMEOUT}s")
+            self._read_available()
+        response = self._responses.pop(request_id)
+        label = self._pending.pop(request_id)
+        if 'error' in response:
+            raise AssertionError(f"Node.js call {label} failed:\n{response['error']}")
+        return response
+
+    def _write(self, data):
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(self._stdin_fd, view):]
+            except BlockingIOError:
+                pass
+            if view:
+                # The runner stops reading stdin while its stdout pipe is
+                # full, so keep draining responses until there is room again.
+                self._selector.register(self._stdin_fd, selectors.EVENT_WRITE)
+                try:
+                    ready = self._selector.select(NODE_TIMEOUT)
+                finally:
+                    self._selector.unregister(self._stdin_fd)
+                if not ready:
+                    self._abort(f"Node.js worker stopped reading requests for {NODE_TIMEOUT}s")
+                for key, _ in ready:
+                    if key.fd == self._stdout_fd:
+                        self._read_available()
+
+    def _read_available(self):
+        chunk = os.read(self._stdout_fd, 65536)
+        if not chunk:
+            self._abort(f"Node.js worker exited unexpectedly (return code {self._process.poll()})")
+        self._buffer += chunk
+        *lines, rest = self._buffer.split(b'\n')
+        self._buffer = bytearray(rest)
+        for line in lines:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise AssertionError(
+                    f"Malformed response frame from Node.js worker: {e}\nRaw line:\n{line!r}"
+                ) from e
+            self._responses[response['id']] = response
+
+    def detach(self):
+        """Close this process's copies of the worker pipes without stopping it.
+
+        Used in forked children so an inherited stdin handle does not keep
+        the parent's worker alive after the parent closes it.
+        """
+        self._selector.close()
+        self._process.stdin.close()
+        self._process.stdout.close()
+
+    def close(self):
+        """Shut down the worker by closing its stdin, killing it if it lingers."""
+        if self._process.poll() is None:
+            self._selector.close()
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+    def _abort(self, message):
+        """Kill a hung worker, stop get_worker() handing it out, and fail."""
+        global _worker
+        self._process.kill()
+        self._process.wait()
+        self.detach()
+        if _worker is self:
+            _worker = None
+        raise AssertionError(message)
+
+
+_worker = None
+_worker_pid = None
+
+
+def get_worker():
+    """Return this process's shared NodeWorker, starting it on first use.
+
+    The worker is keyed on the current PID so process-parallel test runners
+    (e.g. ``pytest -n auto`` or a ``ProcessPoolExecutor`` over test classes)
+    each get their own Node.js child rather than sharing pipes inherited from
+    a parent process.
+
+    On platforms without POSIX pipe polling (Windows) this raises
+    ``unittest.SkipTest``, so worker-based tests are reported as skipped.
+    """
+    global _worker, _worker_pid
+    if os.name != 'posix':
+        raise unittest.SkipTest("The shared Node.js test worker requires POSIX pipes")
+    if _worker is None or _worker_pid != os.getpid():
+        _worker = NodeWorker()
+        _worker_pid = os.getpid()
+        atexit.register(_worker.close)
+    return _worker
+
+
+def _detach_inherited_worker():
+    global _worker
+    if _worker is not None:
+        _worker.detach()
+        _worker = None
+
+
+# Fork hooks are POSIX-only; elsewhere child processes are spawned fresh and
+# the PID check in get_worker() is enough.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_detach_inherited_worker)
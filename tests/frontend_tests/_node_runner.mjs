@@ -0,0 +1,108 @@
+// Long-lived Node.js worker for frontend tests.
+// Frontend modules are imported once at startup and addressed by short key;
+// each stdin line is a JSON request { id, ns, fn, args } answered by one
+// JSON line on stdout carrying either `result` or `error`.
+// Requests with a `dom` map ({ elementId: [initialClasses] }) run against a
+// fresh mock document and also return the resulting element state; requests
+// with a `storage` map run against a fresh localStorage seeded from it and
+// also return the stored entries afterwards. Browser globals installed while
+// handling a request are restored afterwards, so no request sees another's.
+import { createInterface } from 'node:readline';
+
+// Frontend sources are imported as-is (the frontend has no build step); the
+// module graph is loaded once per worker, so bundling would save nothing per call.
+import * as attention from '../../frontend/src/views/attentionView.js';
+import * as visibility from '../../frontend/src/utils/chartVisibility.js';
+import * as header from '../../frontend/src/views/headerView.js';
+import * as chart from '../../frontend/src/utils/chart.js';
+import * as fmt from '../../frontend/src/utils/formatters.js';
+import * as kpi from '../../frontend/src/views/kpiView.js';
+import * as repo from '../../frontend/src/views/repoView.js';
+import * as pipeline from '../../frontend/src/views/pipelineView.js';
+import * as service from '../../frontend/src/views/serviceView.js';
+import * as history from './fixtures/history_app.mjs';
+import * as canvas from './fixtures/chart_mock.mjs';
+import * as kpiSlo from './fixtures/kpi_slo.mjs';
+import * as sparklines from './fixtures/sparklines.mjs';
+import {
+    makeElement,
+    installDocument,
+    describeElement,
+    installLocalStorage
+} from './fixtures/dom_mock.mjs';
+
+const registry = {
+    attention, visibility, header, chart, fmt, kpi, repo, pipeline, service,
+    history, canvas, kpiSlo, sparklines
+};
+
+// Stdout carries one response per line. Frontend code logs progress with
+// console.log (e.g. the header toggles), so send all console output to stderr
+// to keep stray text from being read as a response frame.
+console.log = console.info = console.debug = console.error;
+
+// Browser globals that requests (mock document/localStorage) or fixtures
+// (TestDashboardApp's window) install on globalThis.
+const BROWSER_GLOBALS = ['window', 'document', 'localStorage'];
+
+function saveGlobals() {
+    return BROWSER_GLOBALS.map(name => [name, Object.getOwnPropertyDescriptor(globalThis, name)]);
+}
+
+function restoreGlobals(saved) {
+    for (const [name, descriptor] of saved) {
+        if (descriptor) {
+            Object.defineProperty(globalThis, name, descriptor);
+        } else {
+            delete globalThis[name];
+        }
+    }
+}
+
+function dispatch({ ns, fn, args }) {
+    const mod = registry[ns];
+    if (!mod || typeof mod[fn] !== 'function') {
+        throw new Error(`Unknown function ${ns}.${fn}`);
+    }
+    return mod[fn](...(args || []));
+}
+
+function handle(request) {
+    if (request.storage !== undefined) {
+        const storage = installLocalStorage(request.storage);
+        return { ...handleDom(request), storage };
+    }
+    return handleDom(request);
+}
+
+function handleDom(request) {
+    if (request.dom === undefined) {
+        return { result: dispatch(request) ?? null };
+    }
+    const elements = {};
+    for (const [id, classes] of Object.entries(request.dom)) {
+        elements[id] = makeElement(classes);
+    }
+    installDocument(elements);
+    const result = dispatch(request) ?? null;
+    const dom = {};
+    for (const [id, el] of Object.entries(elements)) {
+        dom[id] = describeElement(el);
+    }
+    return { result, dom };
+}
+
+for await (const line of createInterface({ input: process.stdin })) {
+    if (!line) continue;
+    const request = JSON.parse(line);
+    const saved = saveGlobals();
+    let response;
+    try {
+        response = { id: request.id, ...handle(request) };
+    } catch (e) {
+        response = { id: request.id, error: e.stack || String(e) };
+    } finally {
+        restoreGlobals(saved);
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+}
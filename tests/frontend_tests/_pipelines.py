@@ -0,0 +1,19 @@
+"""Pipeline fixtures shared by the pipelineView.js tests."""
+
+# A successful default-branch pipeline with no DSO indicators
+DEFAULT_PIPELINE = {
+    'status': 'success',
+    'project_name': 'test-project',
+    'ref': 'main',
+    'sha': 'abc12345',
+    'created_at': '2024-01-20T10:30:00.000Z',
+    'duration': 245,
+    'is_default_branch': True,
+    'has_runner_issues': False,
+    'has_failing_jobs': False,
+}
+
+
+def make_pipeline(**overrides):
+    """Return a copy of DEFAULT_PIPELINE with ``overrides`` applied."""
+    return {**DEFAULT_PIPELINE, **overrides}
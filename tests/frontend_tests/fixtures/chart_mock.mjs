@@ -0,0 +1,48 @@
+// Canvas stand-in for chart.js tests running in the shared Node worker.
+import { renderJobPerformanceChart } from '../../../frontend/src/utils/chart.js';
+
+/**
+ * Create a mock canvas whose 2D context accepts every drawing call
+ * @returns {Object} - Mock canvas element
+ */
+export function makeCanvas() {
+    return {
+        getContext: () => ({
+            clearRect: () => {},
+            beginPath: () => {},
+            moveTo: () => {},
+            lineTo: () => {},
+            stroke: () => {},
+            fillRect: () => {},
+            fillText: () => {},
+            measureText: () => ({ width: 50 }),
+            setLineDash: () => {},
+            strokeStyle: '',
+            fillStyle: '',
+            lineWidth: 0,
+            font: '',
+            textAlign: '',
+            textBaseline: '',
+        }),
+        width: 800,
+        height: 400,
+        style: {},
+        _pointCoordinates: [],
+    };
+}
+
+/**
+ * Render the job performance chart onto one mock canvas once per options
+ * object (or once with no options when none are given)
+ * @param {Array} data - Analytics data points
+ * @param {...Object} optionsList - Options for each successive render
+ * @returns {boolean} - True once every render has returned without throwing
+ */
+export function renderOnMockCanvas(data, ...optionsList) {
+    const canvas = makeCanvas();
+    if (optionsList.length === 0) {
+        renderJobPerformanceChart(canvas, data);
+    }
+    optionsList.forEach(options => renderJobPerformanceChart(canvas, data, options));
+    return true;
+}
@@ -0,0 +1,111 @@
+// Minimal DOM and localStorage stand-ins for frontend tests running under Node.js.
+// Loaded once by _node_runner.mjs; each request installs fresh globals.
+
+/**
+ * Create a mock element with a classList shim and appendChild tracking
+ * @param {Array<string>} [classes=[]] - Initial CSS classes
+ * @returns {Object} - Mock element
+ */
+export function makeElement(classes = []) {
+    return {
+        innerHTML: '',
+        textContent: '',
+        className: '',
+        _children: [],
+        classList: {
+            _classes: new Set(classes),
+            add: function(c) { this._classes.add(c); },
+            remove: function(...cs) { cs.forEach(c => this._classes.delete(c)); },
+            has: function(c) { return this._classes.has(c); }
+        },
+        appendChild: function(child) {
+            this._children.push(child);
+        }
+    };
+}
+
+/**
+ * Install a global document exposing only the given elements by id
+ * @param {Object<string, Object>} elements - Map of element id to mock element
+ */
+export function installDocument(elements) {
+    globalThis.document = {
+        getElementById: function(id) {
+            return elements[id] ?? null;
+        },
+        // No selector matches: views treat the element as absent
+        querySelector: function() {
+            return null;
+        },
+        createElement: function(tag) {
+            return {
+                tagName: tag.toUpperCase(),
+                className: '',
+                innerHTML: '',
+                textContent: '',
+                _children: [],
+                appendChild: function(child) {
+                    this._children.push(child);
+                }
+            };
+        }
+    };
+}
+
+/**
+ * Install a global document that creates any element on first lookup by id
+ * @returns {Object} - The installed mock document
+ */
+export function installLazyDocument() {
+    const elements = {};
+    globalThis.document = {
+        getElementById: function(id) {
+            if (!elements[id]) {
+                elements[id] = makeElement();
+            }
+            return elements[id];
+        },
+        // No selector matches: views treat the element as absent
+        querySelector: function() {
+            return null;
+        }
+    };
+    return globalThis.document;
+}
+
+/**
+ * Summarize a mock element as plain JSON for assertions on the Python side
+ * @param {Object} el - Mock element created by makeElement
+ * @returns {Object} - { classes, textContent, children: [{ className, textContent }] }
+ */
+export function describeElement(el) {
+    return {
+        classes: [...el.classList._classes],
+        textContent: el.textContent,
+        children: el._children.map(child => ({
+            className: child.className,
+            textContent: child.textContent
+        }))
+    };
+}
+
+/**
+ * Install a global localStorage backed by a plain object
+ * @param {Object<string, string>} entries - Initial stored key/value pairs
+ * @returns {Object<string, string>} - Backing object, mutated by setItem/removeItem
+ */
+export function installLocalStorage(entries) {
+    const data = { ...entries };
+    globalThis.localStorage = {
+        getItem: function(key) {
+            return Object.hasOwn(data, key) ? data[key] : null;
+        },
+        setItem: function(key, value) {
+            data[key] = String(value);
+        },
+        removeItem: function(key) {
+            delete data[key];
+        }
+    };
+    return data;
+}
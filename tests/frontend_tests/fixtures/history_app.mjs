@@ -0,0 +1,89 @@
+// History buffer scenarios for DashboardApp, run inside the shared Node worker.
+// Each scenario builds a fresh app and returns plain JSON-friendly results.
+import { TestDashboardApp } from './test_dashboard_app.mjs';
+
+// Values that must never enter a history buffer; most do not survive JSON,
+// so the invalid-value scenarios build their inputs here.
+const INVALID_SAMPLES = [null, undefined, 'not a number', NaN, Infinity];
+
+/**
+ * Feed each batch of repos to _updateRepoHistory in order
+ * @param {Array<Array<Object>>} batches - One repo list per simulated refresh
+ * @param {number} [historyWindow] - Points retained per repo (app default when omitted)
+ * @returns {Object<string, Array<number>>} - Repo history by key
+ */
+export function repoHistoryAfter(batches, historyWindow) {
+    const app = new TestDashboardApp(historyWindow);
+    batches.forEach(repos => app._updateRepoHistory(repos));
+    return Object.fromEntries(app.repoHistory);
+}
+
+/**
+ * Feed each batch of services to _updateServiceHistory in order
+ * @param {Array<Array<Object>>} batches - One service list per simulated refresh
+ * @param {number} [historyWindow] - Points retained per service (app default when omitted)
+ * @returns {Object<string, Array<number>>} - Service history by key
+ */
+export function serviceHistoryAfter(batches, historyWindow) {
+    const app = new TestDashboardApp(historyWindow);
+    batches.forEach(services => app._updateServiceHistory(services));
+    return Object.fromEntries(app.serviceHistory);
+}
+
+/**
+ * Update repo history with every invalid rate (ids 1-5), one valid rate (id 6)
+ * and a repo with no rate at all (id 7)
+ * @returns {Object} - { errorOccurred, history }
+ */
+export function repoHistoryWithInvalidRates() {
+    const repos = INVALID_SAMPLES.map((rate, i) => ({ id: i + 1, recent_success_rate: rate }));
+    repos.push({ id: 6, recent_success_rate: 0.85 }, { id: 7 });
+    return updateCatchingErrors(app => app._updateRepoHistory(repos), app => app.repoHistory);
+}
+
+/**
+ * Update service history with every invalid latency (svc1-svc5), one valid
+ * latency (svc6) and a service with no latency at all (svc7)
+ * @returns {Object} - { errorOccurred, history }
+ */
+export function serviceHistoryWithInvalidLatencies() {
+    const services = INVALID_SAMPLES.map((latency, i) => ({ id: `svc${i + 1}`, latency_ms: latency }));
+    services.push({ id: 'svc6', latency_ms: 42 }, { id: 'svc7' });
+    return updateCatchingErrors(app => app._updateServiceHistory(services), app => app.serviceHistory);
+}
+
+function updateCatchingErrors(update, historyOf) {
+    const app = new TestDashboardApp();
+    let errorOccurred = false;
+    try {
+        update(app);
+    } catch (e) {
+        errorOccurred = true;
+    }
+    return { errorOccurred, history: Object.fromEntries(historyOf(app)) };
+}
+
+/**
+ * @param {Array<Object>} repos - Repositories to key
+ * @returns {Array<string>} - _getRepoKey result for each repo
+ */
+export function repoKeys(repos) {
+    const app = new TestDashboardApp();
+    return repos.map(repo => app._getRepoKey(repo));
+}
+
+/**
+ * @param {Array<Object>} services - Services to key
+ * @returns {Array<string>} - _getServiceKey result for each service
+ */
+export function serviceKeys(services) {
+    const app = new TestDashboardApp();
+    return services.map(service => app._getServiceKey(service));
+}
+
+/**
+ * @returns {number} - historyWindow of a freshly constructed app
+ */
+export function defaultHistoryWindow() {
+    return new TestDashboardApp().historyWindow;
+}
@@ -0,0 +1,34 @@
+// SLO KPI rendering scenarios for kpiView.js, run inside the shared Node worker.
+// Each scenario installs a fresh mock document and returns a JSON snapshot.
+import { formatSloPercentage, renderSloKpis } from '../../../frontend/src/views/kpiView.js';
+import { installLazyDocument } from './dom_mock.mjs';
+
+/**
+ * Run renderSloKpis against a fresh mock document and snapshot the SLO elements
+ * @param {Object} data - Summary data passed to renderSloKpis
+ * @returns {Object} - Target and observed text after rendering
+ */
+export function renderSloSnapshot(data) {
+    const doc = installLazyDocument();
+
+    renderSloKpis(data);
+
+    return {
+        targetText: doc.getElementById('pipelineSloTarget').textContent,
+        observedText: doc.getElementById('pipelineSloObserved').textContent
+    };
+}
+
+/**
+ * Format the invalid inputs formatSloPercentage must reject; undefined and
+ * NaN do not survive JSON, so they are built here
+ * @returns {Object<string, string>} - Formatted value by input name
+ */
+export function formatInvalidSloValues() {
+    return {
+        val_null: formatSloPercentage(null),
+        val_undefined: formatSloPercentage(undefined),
+        val_nan: formatSloPercentage(NaN),
+        val_string: formatSloPercentage('0.5')
+    };
+}
@@ -0,0 +1,20 @@
+// Sparkline inputs that do not survive JSON (undefined, NaN), run inside the
+// shared Node worker so the raw values reach the view functions intact.
+import { createRepoSparkline } from '../../../frontend/src/views/repoView.js';
+import { createServiceSparkline } from '../../../frontend/src/views/serviceView.js';
+
+/**
+ * Render a repo sparkline from statuses mixed with null/undefined entries
+ * @returns {string} - Sparkline HTML for the three valid statuses
+ */
+export function repoSparklineWithInvalidStatuses() {
+    return createRepoSparkline([null, 'success', undefined, 'failed', null, 'running']);
+}
+
+/**
+ * Render a service sparkline from latencies mixed with non-numeric and negative entries
+ * @returns {string} - Sparkline HTML for the three valid latencies
+ */
+export function serviceSparklineWithInvalidHistory() {
+    return createServiceSparkline([null, 42, undefined, 55, NaN, 38, 'invalid', -5]);
+}
@@ -0,0 +1,25 @@
+// DashboardApp for tests running under Node.js, without browser globals.
+import { DashboardApp } from '../../../frontend/src/dashboardApp.js';
+
+/**
+ * DashboardApp with init() disabled, so only its state and helper methods
+ * (history buffers, key resolution) are exercised
+ */
+export class TestDashboardApp extends DashboardApp {
+    /**
+     * @param {number} [historyWindow] - Overrides the default window when given
+     */
+    constructor(historyWindow) {
+        // The constructor only needs window for apiBase; the worker restores
+        // the previous window after each request
+        globalThis.window = { location: { origin: 'http://localhost' } };
+        super();
+        if (historyWindow !== undefined) {
+            this.historyWindow = historyWindow;
+        }
+    }
+
+    init() {
+        // No DOM, toggles or data loading under test
+    }
+}
@@ -1,8 +1,12 @@
 """Tests for attentionView.js basic rendering using Node.js ES module import."""
-import json
-import subprocess
+import os
+import sys
 import unittest
-from pathlib import Path
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import get_worker
 
 
 class TestBuildAttentionItems(unittest.TestCase):
@@ -10,201 +14,60 @@ class TestBuildAttentionItems(unittest.TestCase):
 
     def test_build_attention_items_returns_array(self):
         """Test buildAttentionItems returns an array even with items."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [{{ id: 1, name: 'healthy-repo', path_with_namespace: 'group/healthy-repo', 
-               recent_success_rate: 1.0, consecutive_default_branch_failures: 0, has_runner_issues: false }}],
-    services: [{{ id: 'svc', name: 'Healthy Service', status: 'UP', latency_trend: 'stable' }}],
-    pipelines: [{{ id: 100, project_id: 1, ref: 'main' }}]
-}});
-console.log(JSON.stringify({{ isArray: Array.isArray(result), length: result.length }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['isArray'], 'buildAttentionItems should return an array')
+        result = get_worker().call('attention', 'buildAttentionItems', {
+            'summary': {'pipeline_slo_target_default_branch_success_rate': 0.9},
+            'repos': [{'id': 1, 'name': 'healthy-repo', 'path_with_namespace': 'group/healthy-repo',
+                       'recent_success_rate': 1.0, 'consecutive_default_branch_failures': 0, 'has_runner_issues': False}],
+            'services': [{'id': 'svc', 'name': 'Healthy Service', 'status': 'UP', 'latency_trend': 'stable'}],
+            'pipelines': [{'id': 100, 'project_id': 1, 'ref': 'main'}]
+        })
+
+        self.assertIsInstance(result, list, 'buildAttentionItems should return an array')
         # With healthy repos and services, no attention items should be generated
-        self.assertEqual(result['length'], 0, 'buildAttentionItems should return empty array for healthy inputs')
+        self.assertEqual(len(result), 0, 'buildAttentionItems should return empty array for healthy inputs')
 
 
 class TestRenderAttentionStripEmpty(unittest.TestCase):
     """Verify renderAttentionStrip shows 'all clear' message when no items."""
 
     def test_render_attention_strip_empty_state(self):
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ renderAttentionStrip }} from 'file://{attention_view_path}';
-
-// Set up minimal DOM with appendChild support
-const strip = {{
-    innerHTML: '',
-    _children: [],
-    classList: {{
-        _classes: new Set(['attention-strip', 'attention-strip--empty']),
-        add: function(c) {{ this._classes.add(c); }},
-        remove: function(c) {{ this._classes.delete(c); }},
-        has: function(c) {{ return this._classes.has(c); }}
-    }},
-    appendChild: function(child) {{
-        this._children.push(child);
-    }}
-}};
-
-globalThis.document = {{
-    getElementById: function(id) {{
-        if (id === 'attentionStrip') return strip;
-        return null;
-    }},
-    createElement: function(tag) {{
-        return {{
-            tagName: tag.toUpperCase(),
-            className: '',
-            textContent: ''
-        }};
-    }}
-}};
-
-renderAttentionStrip({{
-    summary: null,
-    repos: [],
-    services: [],
-    pipelines: []
-}});
-
-const hasAllClearMessage = strip._children.length > 0 && strip._children[0].textContent.includes('All clear');
-const hasEmptyClass = strip.classList.has('attention-strip--empty');
-console.log(JSON.stringify({{ hasAllClearMessage, hasEmptyClass }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasAllClearMessage'], 'Should display "All clear" message when no attention items')
-        self.assertTrue(result['hasEmptyClass'], 'Should have attention-strip--empty class when no items')
+        dom = get_worker().render('attention', 'renderAttentionStrip', {
+            'summary': None,
+            'repos': [],
+            'services': [],
+            'pipelines': []
+        }, dom={'attentionStrip': ['attention-strip', 'attention-strip--empty']})
+
+        strip = dom['attentionStrip']
+        has_all_clear_message = bool(strip['children']) and 'All clear' in strip['children'][0]['textContent']
+        self.assertTrue(has_all_clear_message, 'Should display "All clear" message when no attention items')
+        self.assertIn('attention-strip--empty', strip['classes'], 'Should have attention-strip--empty class when no items')
 
     def test_render_attention_strip_handles_null_arrays(self):
         """Verify renderAttentionStrip handles null/undefined arrays gracefully."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ renderAttentionStrip }} from 'file://{attention_view_path}';
-
-// Set up minimal DOM with appendChild support
-const strip = {{
-    innerHTML: '',
-    _children: [],
-    classList: {{
-        _classes: new Set(['attention-strip', 'attention-strip--empty']),
-        add: function(c) {{ this._classes.add(c); }},
-        remove: function(c) {{ this._classes.delete(c); }},
-        has: function(c) {{ return this._classes.has(c); }}
-    }},
-    appendChild: function(child) {{
-        this._children.push(child);
-    }}
-}};
-
-globalThis.document = {{
-    getElementById: function(id) {{
-        if (id === 'attentionStrip') return strip;
-        return null;
-    }},
-    createElement: function(tag) {{
-        return {{
-            tagName: tag.toUpperCase(),
-            className: '',
-            textContent: ''
-        }};
-    }}
-}};
-
-// Call with null values - should not throw
-let errorOccurred = false;
-try {{
-    renderAttentionStrip({{
-        summary: null,
-        repos: null,
-        services: undefined,
-        pipelines: null
-    }});
-}} catch (e) {{
-    errorOccurred = true;
-}}
-
-const hasAllClearMessage = strip._children.length > 0 && strip._children[0].textContent.includes('All clear');
-console.log(JSON.stringify({{ errorOccurred, hasAllClearMessage }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertFalse(result['errorOccurred'], 'Should not throw error with null/undefined arrays')
-        self.assertTrue(result['hasAllClearMessage'], 'Should display "All clear" message')
+        # services is omitted so it arrives as undefined on the JS side;
+        # the worker raises AssertionError if renderAttentionStrip throws.
+        dom = get_worker().render('attention', 'renderAttentionStrip', {
+            'summary': None,
+            'repos': None,
+            'pipelines': None
+        }, dom={'attentionStrip': ['attention-strip', 'attention-strip--empty']})
+
+        strip = dom['attentionStrip']
+        has_all_clear_message = bool(strip['children']) and 'All clear' in strip['children'][0]['textContent']
+        self.assertTrue(has_all_clear_message, 'Should display "All clear" message')
 
     def test_render_attention_strip_missing_element(self):
         """Verify renderAttentionStrip gracefully handles missing DOM element."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ renderAttentionStrip }} from 'file://{attention_view_path}';
-
-// Set up minimal DOM without attentionStrip element
-globalThis.document = {{
-    getElementById: function(id) {{
-        return null;  // Element not found
-    }}
-}};
-
-// Call should not throw
-let errorOccurred = false;
-try {{
-    renderAttentionStrip({{
-        summary: null,
-        repos: [],
-        services: [],
-        pipelines: []
-    }});
-}} catch (e) {{
-    errorOccurred = true;
-}}
-
-console.log(JSON.stringify({{ errorOccurred }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertFalse(result['errorOccurred'], 'Should not throw error when element is missing')
+        # No elements registered, so getElementById('attentionStrip') returns null;
+        # the worker raises AssertionError if renderAttentionStrip throws.
+        dom = get_worker().render('attention', 'renderAttentionStrip', {
+            'summary': None,
+            'repos': [],
+            'services': [],
+            'pipelines': []
+        }, dom={})
+        self.assertEqual(dom, {})
 
 
 if __name__ == '__main__':
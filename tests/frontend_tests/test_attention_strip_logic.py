@@ -1,216 +1,103 @@
 """Tests for attentionView.js attention strip selection logic using Node.js ES module import."""
-import json
-import subprocess
+import os
+import sys
 import unittest
-from pathlib import Path
-
-
-class TestBuildAttentionItemsRepos(unittest.TestCase):
-    """Verify buildAttentionItems correctly identifies repos needing attention."""
-
-    def test_repo_with_runner_issues(self):
-        """Test repo with has_runner_issues=true returns critical severity item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [{{ id: 1, name: 'test-repo', path_with_namespace: 'group/test-repo', has_runner_issues: true }}],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['type'], 'repo')
-        self.assertEqual(items[0]['severity'], 'critical')
-        self.assertIn('Runner issue', items[0]['reason'])
-
-    def test_repo_with_consecutive_failures(self):
-        """Test repo with consecutive_default_branch_failures > 0 returns high severity item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [{{ id: 1, name: 'test-repo', path_with_namespace: 'group/test-repo', consecutive_default_branch_failures: 3, has_runner_issues: false }}],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['type'], 'repo')
-        self.assertEqual(items[0]['severity'], 'high')
-        self.assertIn('Default branch failing', items[0]['reason'])
-        self.assertIn('3 times', items[0]['reason'])
-
-    def test_repo_below_slo_target(self):
-        """Test repo with recent_success_rate below SLO target returns medium severity item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [{{ id: 1, name: 'test-repo', path_with_namespace: 'group/test-repo', recent_success_rate: 0.75, consecutive_default_branch_failures: 0, has_runner_issues: false }}],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['type'], 'repo')
-        self.assertEqual(items[0]['severity'], 'medium')
-        self.assertIn('Success rate', items[0]['reason'])
-        self.assertIn('75%', items[0]['reason'])
-
-    def test_repo_uses_default_slo_target_when_missing(self):
-        """Test that default SLO target (0.9) is used when summary doesn't provide one."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: null,
-    repos: [{{ id: 1, name: 'test-repo', path_with_namespace: 'group/test-repo', recent_success_rate: 0.85, consecutive_default_branch_failures: 0, has_runner_issues: false }}],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        # 0.85 is below default 0.9 target, so should get an item
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['severity'], 'medium')
-
-
-class TestBuildAttentionItemsServices(unittest.TestCase):
-    """Verify buildAttentionItems correctly identifies services needing attention."""
-
-    def test_service_down(self):
-        """Test service with status DOWN returns critical severity item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: null,
-    repos: [],
-    services: [{{ id: 'svc1', name: 'Test Service', status: 'DOWN' }}],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['type'], 'service')
-        self.assertEqual(items[0]['severity'], 'critical')
-        self.assertIn('offline', items[0]['reason'])
-
-    def test_service_latency_warning(self):
-        """Test service with latency_trend warning returns medium severity item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: null,
-    repos: [],
-    services: [{{ id: 'svc1', name: 'Test Service', status: 'UP', latency_trend: 'warning' }}],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['type'], 'service')
-        self.assertEqual(items[0]['severity'], 'medium')
-        self.assertIn('Latency', items[0]['reason'])
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import get_worker
+
+
+_SLO_SUMMARY = {'pipeline_slo_target_default_branch_success_rate': 0.9}
+
+
+def attention_payload(summary=None, repos=(), services=(), pipelines=()):
+    """Build a buildAttentionItems/renderAttentionStrip input from shared parts."""
+    return {
+        'summary': summary,
+        'repos': list(repos),
+        'services': list(services),
+        'pipelines': list(pipelines),
+    }
+
+
+def build_attention_items(payload):
+    """Call buildAttentionItems in the shared Node.js worker."""
+    return get_worker().call('attention', 'buildAttentionItems', payload)
+
+
+# (name, payload, expected type, expected severity, expected reason fragments)
+# for inputs that should produce exactly one attention item.
+SINGLE_ITEM_CASES = [
+    (
+        'repo_with_runner_issues',
+        attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[{'id': 1, 'name': 'test-repo', 'path_with_namespace': 'group/test-repo', 'has_runner_issues': True}],
+        ),
+        'repo', 'critical', ['Runner issue'],
+    ),
+    (
+        'repo_with_consecutive_failures',
+        attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[{'id': 1, 'name': 'test-repo', 'path_with_namespace': 'group/test-repo', 'consecutive_default_branch_failures': 3, 'has_runner_issues': False}],
+        ),
+        'repo', 'high', ['Default branch failing', '3 times'],
+    ),
+    (
+        'repo_below_slo_target',
+        attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[{'id': 1, 'name': 'test-repo', 'path_with_namespace': 'group/test-repo', 'recent_success_rate': 0.75, 'consecutive_default_branch_failures': 0, 'has_runner_issues': False}],
+        ),
+        'repo', 'medium', ['Success rate', '75%'],
+    ),
+    (
+        # 0.85 is below the default 0.9 target used when summary has none
+        'repo_uses_default_slo_target_when_missing',
+        attention_payload(
+            repos=[{'id': 1, 'name': 'test-repo', 'path_with_namespace': 'group/test-repo', 'recent_success_rate': 0.85, 'consecutive_default_branch_failures': 0, 'has_runner_issues': False}],
+        ),
+        'repo', 'medium', [],
+    ),
+    (
+        'service_down',
+        attention_payload(
+            services=[{'id': 'svc1', 'name': 'Test Service', 'status': 'DOWN'}],
+        ),
+        'service', 'critical', ['offline'],
+    ),
+    (
+        'service_latency_warning',
+        attention_payload(
+            services=[{'id': 'svc1', 'name': 'Test Service', 'status': 'UP', 'latency_trend': 'warning'}],
+        ),
+        'service', 'medium', ['Latency'],
+    ),
+]
+
+
+class TestBuildAttentionItemsSingleItem(unittest.TestCase):
+    """Verify buildAttentionItems flags individual repos and services needing attention."""
+
+    def test_single_item_cases(self):
+        """Test each unhealthy repo/service yields one item with the expected type and severity."""
+        for name, payload, expected_type, expected_severity, reason_fragments in SINGLE_ITEM_CASES:
+            with self.subTest(name):
+                items = build_attention_items(payload)
+                self.assertEqual(len(items), 1)
+                self.assertEqual(items[0]['type'], expected_type)
+                self.assertEqual(items[0]['severity'], expected_severity)
+                for fragment in reason_fragments:
+                    self.assertIn(fragment, items[0]['reason'])
 
     def test_service_healthy_no_item(self):
         """Test healthy service with UP status and no latency warning returns no item."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: null,
-    repos: [],
-    services: [{{ id: 'svc1', name: 'Test Service', status: 'UP', latency_trend: 'stable' }}],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
+        items = build_attention_items(attention_payload(
+            services=[{'id': 'svc1', 'name': 'Test Service', 'status': 'UP', 'latency_trend': 'stable'}],
+        ))
         self.assertEqual(len(items), 0)
 
 
@@ -219,35 +106,18 @@ class TestBuildAttentionItemsSorting(unittest.TestCase):
 
     def test_critical_items_first(self):
         """Test that critical severity items appear before high and medium severity items."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [
-        {{ id: 1, name: 'medium-repo', path_with_namespace: 'group/medium-repo', recent_success_rate: 0.75, consecutive_default_branch_failures: 0, has_runner_issues: false }},
-        {{ id: 2, name: 'high-repo', path_with_namespace: 'group/high-repo', consecutive_default_branch_failures: 2, has_runner_issues: false }},
-        {{ id: 3, name: 'critical-repo', path_with_namespace: 'group/critical-repo', has_runner_issues: true }}
-    ],
-    services: [
-        {{ id: 'svc1', name: 'Down Service', status: 'DOWN' }},
-        {{ id: 'svc2', name: 'Latency Service', status: 'UP', latency_trend: 'warning' }}
-    ],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
+        items = build_attention_items(attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[
+                {'id': 1, 'name': 'medium-repo', 'path_with_namespace': 'group/medium-repo', 'recent_success_rate': 0.75, 'consecutive_default_branch_failures': 0, 'has_runner_issues': False},
+                {'id': 2, 'name': 'high-repo', 'path_with_namespace': 'group/high-repo', 'consecutive_default_branch_failures': 2, 'has_runner_issues': False},
+                {'id': 3, 'name': 'critical-repo', 'path_with_namespace': 'group/critical-repo', 'has_runner_issues': True}
+            ],
+            services=[
+                {'id': 'svc1', 'name': 'Down Service', 'status': 'DOWN'},
+                {'id': 'svc2', 'name': 'Latency Service', 'status': 'UP', 'latency_trend': 'warning'}
+            ],
+        ))
         # Check that we have items
         self.assertGreater(len(items), 0)
         
@@ -271,10 +141,7 @@ class TestBuildAttentionItemsTruncation(unittest.TestCase):
 
     def test_max_items_truncation(self):
         """Test that items are truncated to maximum 8 items."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        # Create 10 repos with issues using proper JSON serialization
+        # Create 10 repos with issues
         repos = [
             {
                 'id': i,
@@ -286,28 +153,12 @@ class TestBuildAttentionItemsTruncation(unittest.TestCase):
             }
             for i in range(1, 11)
         ]
-        repos_json = json.dumps(repos)
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: {repos_json},
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify({{ length: result.length }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertEqual(result['length'], 8, 'Should truncate to 8 items')
+
+        items = build_attention_items(attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=repos,
+        ))
+        self.assertEqual(len(items), 8, 'Should truncate to 8 items')
 
 
 class TestBuildAttentionItemsEmptyInputs(unittest.TestCase):
@@ -315,62 +166,19 @@ class TestBuildAttentionItemsEmptyInputs(unittest.TestCase):
 
     def test_empty_arrays(self):
         """Test with empty arrays returns empty result."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: null,
-    repos: [],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify({{ length: result.length }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertEqual(result['length'], 0)
+        items = build_attention_items(attention_payload())
+        self.assertEqual(len(items), 0)
 
     def test_null_arrays(self):
         """Test with null arrays returns empty result without error."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-let errorOccurred = false;
-let result;
-try {{
-    result = buildAttentionItems({{
-        summary: null,
-        repos: null,
-        services: undefined,
-        pipelines: null
-    }});
-}} catch (e) {{
-    errorOccurred = true;
-}}
-console.log(JSON.stringify({{ errorOccurred, length: result ? result.length : -1 }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertFalse(result['errorOccurred'], 'Should not throw error with null/undefined arrays')
-        self.assertEqual(result['length'], 0)
+        # services is omitted so it arrives as undefined on the JS side;
+        # the worker raises AssertionError if buildAttentionItems throws.
+        items = build_attention_items({
+            'summary': None,
+            'repos': None,
+            'pipelines': None
+        })
+        self.assertEqual(len(items), 0)
 
 
 class TestBuildAttentionItemsNoDuplicates(unittest.TestCase):
@@ -378,31 +186,13 @@ class TestBuildAttentionItemsNoDuplicates(unittest.TestCase):
 
     def test_no_duplicate_repos(self):
         """Test that repos with multiple issues only appear once."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ buildAttentionItems }} from 'file://{attention_view_path}';
-const result = buildAttentionItems({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [
-        {{ id: 1, name: 'multi-issue-repo', path_with_namespace: 'group/multi-issue-repo', 
-           has_runner_issues: true, consecutive_default_branch_failures: 3, recent_success_rate: 0.5 }}
-    ],
-    services: [],
-    pipelines: []
-}});
-console.log(JSON.stringify(result));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        items = json.loads(completed.stdout.strip())
+        items = build_attention_items(attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[
+                {'id': 1, 'name': 'multi-issue-repo', 'path_with_namespace': 'group/multi-issue-repo',
+                 'has_runner_issues': True, 'consecutive_default_branch_failures': 3, 'recent_success_rate': 0.5}
+            ],
+        ))
         # Should only have one item for the repo (highest severity wins)
         self.assertEqual(len(items), 1)
         # Should be critical severity (runner issues)
@@ -414,72 +204,20 @@ class TestRenderAttentionStripWithItems(unittest.TestCase):
 
     def test_render_items_with_classes(self):
         """Test that items are rendered with type and severity CSS classes."""
-        project_root = Path(__file__).resolve().parents[2]
-        attention_view_path = project_root / 'frontend' / 'src' / 'views' / 'attentionView.js'
-
-        script = f"""
-import {{ renderAttentionStrip }} from 'file://{attention_view_path}';
-
-// Set up minimal DOM
-const strip = {{
-    innerHTML: '',
-    _children: [],
-    classList: {{
-        _classes: new Set(['attention-strip']),
-        add: function(c) {{ this._classes.add(c); }},
-        remove: function(c) {{ this._classes.delete(c); }},
-        has: function(c) {{ return this._classes.has(c); }}
-    }},
-    appendChild: function(child) {{
-        this._children.push(child);
-    }}
-}};
-
-globalThis.document = {{
-    getElementById: function(id) {{
-        if (id === 'attentionStrip') return strip;
-        return null;
-    }},
-    createElement: function(tag) {{
-        return {{
-            tagName: tag.toUpperCase(),
-            className: '',
-            innerHTML: '',
-            textContent: '',
-            _children: [],
-            appendChild: function(child) {{
-                this._children.push(child);
-            }}
-        }};
-    }}
-}};
-
-renderAttentionStrip({{
-    summary: {{ pipeline_slo_target_default_branch_success_rate: 0.9 }},
-    repos: [{{ id: 1, name: 'critical-repo', path_with_namespace: 'group/critical-repo', has_runner_issues: true }}],
-    services: [{{ id: 'svc1', name: 'Down Service', status: 'DOWN' }}],
-    pipelines: []
-}});
-
-const classes = strip._children.map(c => c.className);
-const hasRepoItem = classes.some(c => c.includes('attention-item--repo') && c.includes('attention-item--critical'));
-const hasServiceItem = classes.some(c => c.includes('attention-item--service') && c.includes('attention-item--critical'));
-const notEmpty = !strip.classList.has('attention-strip--empty');
-console.log(JSON.stringify({{ hasRepoItem, hasServiceItem, notEmpty, childCount: strip._children.length }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasRepoItem'], 'Should have repo item with correct classes')
-        self.assertTrue(result['hasServiceItem'], 'Should have service item with correct classes')
-        self.assertTrue(result['notEmpty'], 'Should not have empty class when items exist')
-        self.assertEqual(result['childCount'], 2)
+        dom = get_worker().render('attention', 'renderAttentionStrip', attention_payload(
+            summary=_SLO_SUMMARY,
+            repos=[{'id': 1, 'name': 'critical-repo', 'path_with_namespace': 'group/critical-repo', 'has_runner_issues': True}],
+            services=[{'id': 'svc1', 'name': 'Down Service', 'status': 'DOWN'}],
+        ), dom={'attentionStrip': ['attention-strip']})
+
+        strip = dom['attentionStrip']
+        classes = [child['className'] for child in strip['children']]
+        has_repo_item = any('attention-item--repo' in c and 'attention-item--critical' in c for c in classes)
+        has_service_item = any('attention-item--service' in c and 'attention-item--critical' in c for c in classes)
+        self.assertTrue(has_repo_item, 'Should have repo item with correct classes')
+        self.assertTrue(has_service_item, 'Should have service item with correct classes')
+        self.assertNotIn('attention-strip--empty', strip['classes'], 'Should not have empty class when items exist')
+        self.assertEqual(len(strip['children']), 2)
 
 
 if __name__ == '__main__':
@@ -1,42 +1,25 @@
-"""Tests for frontend escapeHtml utility using Node.js ES module import."""
-import json
-import subprocess
+"""Tests for frontend escapeHtml utility in formatters.js."""
+import os
+import sys
 import unittest
-from pathlib import Path
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import get_worker
 
 
 class TestEscapeHtml(unittest.TestCase):
     """Verify escapeHtml handles falsy values without losing data."""
 
     def test_escape_html_preserves_falsy_values(self):
-        project_root = Path(__file__).resolve().parents[2]
-        formatter_path = project_root / 'frontend' / 'src' / 'utils' / 'formatters.js'
-
-        script = f"""
-import {{ escapeHtml }} from 'file://{formatter_path}';
-const results = [
-  escapeHtml(0),
-  escapeHtml(false),
-  escapeHtml(''),
-  escapeHtml(null),
-  escapeHtml(undefined)
-];
-console.log(JSON.stringify(results));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        outputs = json.loads(completed.stdout.strip())
-        self.assertEqual(outputs[0], '0')
-        self.assertEqual(outputs[1], 'false')
-        self.assertEqual(outputs[2], '')
-        self.assertEqual(outputs[3], '')
-        self.assertEqual(outputs[4], '')
+        worker = get_worker()
+        self.assertEqual(worker.call('fmt', 'escapeHtml', 0), '0')
+        self.assertEqual(worker.call('fmt', 'escapeHtml', False), 'false')
+        self.assertEqual(worker.call('fmt', 'escapeHtml', ''), '')
+        self.assertEqual(worker.call('fmt', 'escapeHtml', None), '')
+        # No argument at all: escapeHtml(undefined)
+        self.assertEqual(worker.call('fmt', 'escapeHtml'), '')
 
 
 if __name__ == '__main__':
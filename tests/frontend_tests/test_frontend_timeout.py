@@ -1,32 +1,41 @@
 """
 Tests for frontend fetch timeout functionality
 """
-import unittest
-import re
 import os
+import re
+import sys
+import unittest
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import PROJECT_ROOT
+
+DASHBOARD_PATH = PROJECT_ROOT / 'frontend' / 'src' / 'dashboardApp.js'
+API_CLIENT_PATH = PROJECT_ROOT / 'frontend' / 'src' / 'api' / 'apiClient.js'
+
+# Function signature with a default timeout parameter; the default may be a
+# numeric literal (8000) or a constant name (DEFAULT_TIMEOUT)
+DEFAULT_TIMEOUT_RE = re.compile(r'async function fetchWithTimeout\([^)]*timeoutMs\s*=\s*\w+')
+# fetch( calls that are not part of a fetchWithTimeout( call
+DIRECT_FETCH_RE = re.compile(r'(?<!fetchWith)\bfetch\s*\(')
+FETCH_RE = re.compile(r'\bfetch\s*\(')
+IMPORT_FROM_RE = re.compile(r"from\s+['\"]([^'\"]+)['\"]")
 
 
 class TestFetchTimeoutImplementation(unittest.TestCase):
     """Test that fetch timeout is properly implemented in frontend code"""
     
-    def setUp(self):
-        """Load frontend files (ES modules)"""
-        # Compute path relative to this test file's location
-        test_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(test_dir))
-        
+    @classmethod
+    def setUpClass(cls):
+        """Load frontend files (ES modules) once; tests only read them"""
         # Load the dashboardApp.js file
-        dashboard_path = os.path.join(project_root, 'frontend', 'src', 'dashboardApp.js')
-        with open(dashboard_path, 'r') as f:
-            self.app_js_content = f.read()
+        with open(DASHBOARD_PATH, 'r') as f:
+            cls.app_js_content = f.read()
         
         # Load the apiClient.js file (where fetchWithTimeout now lives)
-        api_client_path = os.path.join(project_root, 'frontend', 'src', 'api', 'apiClient.js')
-        with open(api_client_path, 'r') as f:
-            self.api_client_content = f.read()
-        
-        # Combined content for some tests
-        self.all_frontend_content = self.app_js_content + self.api_client_content
+        with open(API_CLIENT_PATH, 'r') as f:
+            cls.api_client_content = f.read()
     
     def test_fetchWithTimeout_function_exists(self):
         """Test that fetchWithTimeout function is defined in apiClient.js"""
@@ -36,10 +45,8 @@ class TestFetchTimeoutImplementation(unittest.TestCase):
     def test_fetchWithTimeout_has_default_timeout(self):
         """Test that fetchWithTimeout has a default timeout parameter"""
         # Check for function signature with default parameter in apiClient.js
-        # Matches either a numeric literal (8000) or a constant name (DEFAULT_TIMEOUT)
-        pattern = r'async function fetchWithTimeout\([^)]*timeoutMs\s*=\s*\w+'
         self.assertTrue(
-            re.search(pattern, self.api_client_content),
+            DEFAULT_TIMEOUT_RE.search(self.api_client_content),
             "fetchWithTimeout should have a default timeout parameter"
         )
     
@@ -75,11 +82,12 @@ class TestFetchTimeoutImplementation(unittest.TestCase):
             'checkBackendHealth'
         ]
         for func_name in api_functions:
-            self.assertIn(
-                f'export async function {func_name}',
-                self.api_client_content,
-                f"{func_name} should be exported from apiClient.js"
-            )
+            with self.subTest(func_name):
+                self.assertIn(
+                    f'export async function {func_name}',
+                    self.api_client_content,
+                    f"{func_name} should be exported from apiClient.js"
+                )
     
     def test_dashboardApp_imports_api_client(self):
         """Test that DashboardApp imports from apiClient.js"""
@@ -104,34 +112,33 @@ class TestFetchTimeoutImplementation(unittest.TestCase):
             'checkBackendHealth('
         ]
         for api_call in api_calls:
-            self.assertIn(
-                api_call,
-                self.app_js_content,
-                f"DashboardApp should use {api_call.rstrip('(')}"
-            )
+            with self.subTest(api_call):
+                self.assertIn(
+                    api_call,
+                    self.app_js_content,
+                    f"DashboardApp should use {api_call.rstrip('(')}"
+                )
     
     def test_no_direct_fetch_in_dashboardApp(self):
         """Test that DashboardApp doesn't make direct fetch() calls"""
         # Count direct fetch calls in dashboardApp.js
         # There should be no direct fetch() calls since we use the API client
-        direct_fetch_pattern = r'(?<!fetchWith)\bfetch\s*\('
-        direct_fetches = re.findall(direct_fetch_pattern, self.app_js_content)
+        direct_fetches = sum(1 for _ in DIRECT_FETCH_RE.finditer(self.app_js_content))
         self.assertEqual(
-            len(direct_fetches),
+            direct_fetches,
             0,
-            f"DashboardApp should not have direct fetch() calls, found {len(direct_fetches)}"
+            f"DashboardApp should not have direct fetch() calls, found {direct_fetches}"
         )
     
     def test_single_fetch_in_api_client(self):
         """Test that only one fetch exists in apiClient.js (inside fetchWithTimeout)"""
         # Count fetch calls in apiClient.js
         # We expect exactly 1 direct fetch call (inside fetchWithTimeout function)
-        direct_fetch_pattern = r'\bfetch\s*\('
-        direct_fetches = re.findall(direct_fetch_pattern, self.api_client_content)
+        direct_fetches = sum(1 for _ in FETCH_RE.finditer(self.api_client_content))
         self.assertEqual(
-            len(direct_fetches),
+            direct_fetches,
             1,
-            f"Should have exactly 1 direct fetch() call in apiClient.js, found {len(direct_fetches)}"
+            f"Should have exactly 1 direct fetch() call in apiClient.js, found {direct_fetches}"
         )
     
     def test_fetchTimeout_property_exists(self):
@@ -151,11 +158,12 @@ class TestFetchTimeoutImplementation(unittest.TestCase):
         ]
         
         for endpoint in api_endpoints:
-            self.assertIn(
-                endpoint,
-                self.api_client_content,
-                f"Endpoint {endpoint} should be defined in apiClient.js"
-            )
+            with self.subTest(endpoint):
+                self.assertIn(
+                    endpoint,
+                    self.api_client_content,
+                    f"Endpoint {endpoint} should be defined in apiClient.js"
+                )
     
     def test_no_external_dependencies(self):
         """Test that no external dependencies are imported (ES modules only use local imports)"""
@@ -168,7 +176,7 @@ class TestFetchTimeoutImplementation(unittest.TestCase):
                 # Extract the module path from the import statement
                 if 'from' in import_line:
                     # Find the quoted path
-                    match = re.search(r"from\s+['\"]([^'\"]+)['\"]", import_line)
+                    match = IMPORT_FROM_RE.search(import_line)
                     if match:
                         module_path = match.group(1)
                         self.assertTrue(
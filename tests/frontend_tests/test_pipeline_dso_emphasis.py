@@ -1,181 +1,75 @@
-"""Tests for pipelineView.js DSO emphasis features using Node.js ES module import."""
-import json
-import subprocess
+"""Tests for pipelineView.js DSO emphasis features using the shared Node.js worker."""
+import os
+import sys
 import unittest
-from pathlib import Path
 
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-class TestPipelineDSOEmphasis(unittest.TestCase):
-    """Test DSO emphasis for default branch and runner/job issues in pipeline rows."""
-
-    def setUp(self):
-        self.project_root = Path(__file__).resolve().parents[2]
-        self.pipeline_view_path = self.project_root / 'frontend' / 'src' / 'views' / 'pipelineView.js'
-
-    def run_node_script(self, script):
-        """Run a Node.js script and return the parsed JSON output."""
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return json.loads(completed.stdout.strip())
+from tests.frontend_tests._node import get_worker
+from tests.frontend_tests._pipelines import make_pipeline
 
-    def test_default_branch_row_has_class(self):
-        """Verify default branch pipelines get row-default-branch class."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'success',
-    project_name: 'test-project',
-    ref: 'main',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: true,
-    has_runner_issues: false,
-    has_failing_jobs: false
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasDefaultBranchClass: html.includes('row-default-branch'),
-    hasDefaultBranchProjectName: html.includes('pipeline-project-name default-branch'),
-    hasDefaultBranchRef: html.includes('pipeline-ref default-branch')
-}}));
-"""
-        result = self.run_node_script(script)
-        self.assertTrue(result['hasDefaultBranchClass'], 'Row should have row-default-branch class')
-        self.assertTrue(result['hasDefaultBranchProjectName'], 'Project name should have default-branch class')
-        self.assertTrue(result['hasDefaultBranchRef'], 'Ref should have default-branch class')
+# (name, description, pipeline, {substring: expected presence in the
+# createPipelineRow HTML}); the description leads each failure message.
+EMPHASIS_CASES = [
+    # Default branch pipelines get row and project/ref emphasis
+    ('default_branch_row', 'Default branch row should emphasize the row, project name and ref',
+     make_pipeline(), {
+        'row-default-branch': True,
+        'pipeline-project-name default-branch': True,
+        'pipeline-ref default-branch': True,
+    }),
+    ('non_default_branch_row', 'Non-default branch row should NOT have default-branch emphasis',
+     make_pipeline(ref='feature/test', is_default_branch=False), {
+        'row-default-branch': False,
+        'pipeline-project-name default-branch': False,
+    }),
+    # Runner issues get a row class and a badge
+    ('runner_issue_row', 'Runner issue row should have the row-runner-issue class and badge',
+     make_pipeline(status='failed', has_runner_issues=True), {
+        'row-runner-issue': True,
+        'runner-issue': True,
+    }),
+    ('failing_jobs_on_default_branch', 'Default branch row with failing jobs should have the row-failing-jobs class and badge',
+     make_pipeline(status='failed', has_failing_jobs=True), {
+        'row-failing-jobs': True,
+        'failing-jobs': True,
+    }),
+    # Failing jobs on non-default branch should not show emphasis
+    ('failing_jobs_not_on_default_branch', 'Feature branch row should NOT have failing jobs emphasis',
+     make_pipeline(
+        status='failed', ref='feature/test', is_default_branch=False, has_failing_jobs=True,
+    ), {
+        'row-failing-jobs': False,
+        'failing-jobs': False,
+    }),
+    # Status classes are preserved alongside DSO emphasis classes
+    ('status_class_preserved', 'Status class should be kept alongside default-branch and runner-issue classes',
+     make_pipeline(status='failed', has_runner_issues=True), {
+        'row-status-failed': True,
+        'row-default-branch': True,
+        'row-runner-issue': True,
+    }),
+]
 
-    def test_non_default_branch_row_no_emphasis(self):
-        """Verify non-default branch pipelines don't get default branch emphasis."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'success',
-    project_name: 'test-project',
-    ref: 'feature/test',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: false,
-    has_runner_issues: false,
-    has_failing_jobs: false
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasDefaultBranchClass: html.includes('row-default-branch'),
-    hasDefaultBranchProjectName: html.includes('pipeline-project-name default-branch')
-}}));
-"""
-        result = self.run_node_script(script)
-        self.assertFalse(result['hasDefaultBranchClass'], 'Row should NOT have row-default-branch class')
-        self.assertFalse(result['hasDefaultBranchProjectName'], 'Project name should NOT have default-branch class')
 
-    def test_runner_issue_row_has_class(self):
-        """Verify pipelines with runner issues get row-runner-issue class."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'failed',
-    project_name: 'test-project',
-    ref: 'main',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: true,
-    has_runner_issues: true,
-    has_failing_jobs: false
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasRunnerIssueClass: html.includes('row-runner-issue'),
-    hasRunnerBadge: html.includes('runner-issue')
-}}));
-"""
-        result = self.run_node_script(script)
-        self.assertTrue(result['hasRunnerIssueClass'], 'Row should have row-runner-issue class')
-        self.assertTrue(result['hasRunnerBadge'], 'Row should have runner issue badge')
-
-    def test_failing_jobs_on_default_branch(self):
-        """Verify pipelines with failing jobs on default branch get row-failing-jobs class."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'failed',
-    project_name: 'test-project',
-    ref: 'main',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: true,
-    has_runner_issues: false,
-    has_failing_jobs: true
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasFailingJobsClass: html.includes('row-failing-jobs'),
-    hasWarningBadge: html.includes('failing-jobs')
-}}));
-"""
-        result = self.run_node_script(script)
-        self.assertTrue(result['hasFailingJobsClass'], 'Row should have row-failing-jobs class')
-        self.assertTrue(result['hasWarningBadge'], 'Row should have failing jobs badge')
-
-    def test_failing_jobs_not_on_default_branch(self):
-        """Verify pipelines with failing jobs on feature branch don't get failing-jobs class."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'failed',
-    project_name: 'test-project',
-    ref: 'feature/test',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: false,
-    has_runner_issues: false,
-    has_failing_jobs: true
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasFailingJobsClass: html.includes('row-failing-jobs'),
-    hasWarningBadge: html.includes('failing-jobs')
-}}));
-"""
-        result = self.run_node_script(script)
-        # Failing jobs on non-default branch should not show emphasis
-        self.assertFalse(result['hasFailingJobsClass'], 'Row should NOT have row-failing-jobs class on feature branch')
-        self.assertFalse(result['hasWarningBadge'], 'Row should NOT have failing jobs badge on feature branch')
+class TestPipelineDSOEmphasis(unittest.TestCase):
+    """Test DSO emphasis for default branch and runner/job issues in pipeline rows."""
 
-    def test_status_class_preserved(self):
-        """Verify status classes are preserved alongside DSO emphasis classes."""
-        script = f"""
-import {{ createPipelineRow }} from 'file://{self.pipeline_view_path}';
-const pipeline = {{
-    status: 'failed',
-    project_name: 'test-project',
-    ref: 'main',
-    sha: 'abc12345',
-    created_at: '2024-01-20T10:30:00.000Z',
-    duration: 245,
-    is_default_branch: true,
-    has_runner_issues: true,
-    has_failing_jobs: false
-}};
-const html = createPipelineRow(pipeline);
-console.log(JSON.stringify({{
-    hasStatusClass: html.includes('row-status-failed'),
-    hasDefaultBranchClass: html.includes('row-default-branch'),
-    hasRunnerIssueClass: html.includes('row-runner-issue')
-}}));
-"""
-        result = self.run_node_script(script)
-        self.assertTrue(result['hasStatusClass'], 'Row should have status class')
-        self.assertTrue(result['hasDefaultBranchClass'], 'Row should have default-branch class')
-        self.assertTrue(result['hasRunnerIssueClass'], 'Row should have runner-issue class')
+    def test_emphasis_cases(self):
+        """Test every EMPHASIS_CASES row against createPipelineRow in a single batch."""
+        html_by_name = get_worker().call_batch(
+            'pipeline', 'createPipelineRow',
+            {name: (pipeline,) for name, _, pipeline, _ in EMPHASIS_CASES},
+        )
+        for name, description, _, expected in EMPHASIS_CASES:
+            html = html_by_name[name]
+            for needle, present in expected.items():
+                with self.subTest(name, needle=needle):
+                    if present:
+                        self.assertIn(needle, html, f"{description}: missing {needle!r}")
+                    else:
+                        self.assertNotIn(needle, html, f"{description}: unexpected {needle!r}")
 
 
 if __name__ == '__main__':
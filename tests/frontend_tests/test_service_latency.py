@@ -1,248 +1,142 @@
-"""Tests for service latency display using Node.js ES module import."""
-import json
-import subprocess
+"""Tests for service latency display using the shared Node.js worker."""
+import os
+import sys
 import unittest
-from pathlib import Path
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import get_worker
+
+# formatLatency inputs and their expected output
+VALID_LATENCIES = {
+    42: '42 ms',
+    100.7: '101 ms',
+    0: '0 ms',
+    1.4: '1 ms',
+    1.6: '2 ms',
+}
+
+# Services rendered with createServiceCard, keyed by the test that checks them.
+LATENCY_SERVICES = {
+    'current_latency_only': {
+        'name': 'Test Service',
+        'status': 'up',
+        'latency_ms': 42,
+    },
+    'both_latencies': {
+        'name': 'Test Service',
+        'status': 'up',
+        'latency_ms': 42,
+        'average_latency_ms': 50,
+    },
+    'no_latency': {
+        'name': 'Test Service',
+        'status': 'up',
+    },
+}
+
+WARNING_SERVICES = {
+    'with_latency_warning': {
+        'name': 'Test Service',
+        'status': 'up',
+        'latency_ms': 150,
+        'average_latency_ms': 100,
+        'latency_trend': 'warning',
+    },
+    'without_latency_warning': {
+        'name': 'Test Service',
+        'status': 'up',
+        'latency_ms': 50,
+        'average_latency_ms': 55,
+        'latency_trend': 'stable',
+    },
+    'latency_warning_with_status_up': {
+        'name': 'Test Service',
+        'status': 'up',
+        'latency_ms': 200,
+        'latency_trend': 'warning',
+    },
+}
+
+
+def render_service_cards(services):
+    """Render every service with createServiceCard as one pipelined batch; returns {tag: html}."""
+    return get_worker().call_batch(
+        'service', 'createServiceCard', {tag: (service,) for tag, service in services.items()}
+    )
 
 
 class TestFormatLatency(unittest.TestCase):
     """Verify formatLatency handles various latency values correctly."""
 
-    def test_format_latency_with_valid_values(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ formatLatency }} from 'file://{service_view_path}';
-const results = [
-  formatLatency(42),
-  formatLatency(100.7),
-  formatLatency(0),
-  formatLatency(1.4),
-  formatLatency(1.6)
-];
-console.log(JSON.stringify(results));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.outputs = get_worker().call_batch('service', 'formatLatency', {
+            **{value: (value,) for value in VALID_LATENCIES},
+            'null': (None,),
+            # No argument at all reaches the function as undefined
+            'undefined': (),
+        })
 
-        outputs = json.loads(completed.stdout.strip())
-        self.assertEqual(outputs[0], '42 ms')
-        self.assertEqual(outputs[1], '101 ms')  # Rounded
-        self.assertEqual(outputs[2], '0 ms')
-        self.assertEqual(outputs[3], '1 ms')  # Rounds down
-        self.assertEqual(outputs[4], '2 ms')  # Rounds up
+    def test_format_latency_with_valid_values(self):
+        for value, expected in VALID_LATENCIES.items():
+            with self.subTest(value=value):
+                self.assertEqual(self.outputs[value], expected)
 
     def test_format_latency_with_null_undefined(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ formatLatency }} from 'file://{service_view_path}';
-const results = [
-  formatLatency(null),
-  formatLatency(undefined)
-];
-console.log(JSON.stringify(results));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        outputs = json.loads(completed.stdout.strip())
-        self.assertEqual(outputs[0], 'N/A')
-        self.assertEqual(outputs[1], 'N/A')
+        self.assertEqual(self.outputs['null'], 'N/A')
+        self.assertEqual(self.outputs['undefined'], 'N/A')
 
 
 class TestCreateServiceCardLatency(unittest.TestCase):
     """Verify createServiceCard properly renders latency fields."""
 
-    def test_service_card_with_current_latency_only(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up',
-    latency_ms: 42
-}};
-const html = createServiceCard(service);
-const hasCurrentLatency = html.includes('Current') && html.includes('42 ms');
-const hasAverageLatency = html.includes('Average');
-console.log(JSON.stringify({{ hasCurrentLatency, hasAverageLatency }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.html = render_service_cards(LATENCY_SERVICES)
 
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasCurrentLatency'], 'Should display current latency')
-        self.assertFalse(result['hasAverageLatency'], 'Should not display average latency when not available')
+    def test_service_card_with_current_latency_only(self):
+        html = self.html['current_latency_only']
+        self.assertTrue('Current' in html and '42 ms' in html, 'Should display current latency')
+        self.assertNotIn('Average', html, 'Should not display average latency when not available')
 
     def test_service_card_with_both_latencies(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up',
-    latency_ms: 42,
-    average_latency_ms: 50
-}};
-const html = createServiceCard(service);
-const hasCurrentLatency = html.includes('Current') && html.includes('42 ms');
-const hasAverageLatency = html.includes('Average') && html.includes('50 ms');
-console.log(JSON.stringify({{ hasCurrentLatency, hasAverageLatency }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasCurrentLatency'], 'Should display current latency')
-        self.assertTrue(result['hasAverageLatency'], 'Should display average latency when available')
+        html = self.html['both_latencies']
+        self.assertTrue('Current' in html and '42 ms' in html, 'Should display current latency')
+        self.assertTrue('Average' in html and '50 ms' in html, 'Should display average latency when available')
 
     def test_service_card_with_no_latency(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up'
-}};
-const html = createServiceCard(service);
-const hasCurrentLatency = html.includes('Current');
-const hasNAValue = html.includes('N/A');
-console.log(JSON.stringify({{ hasCurrentLatency, hasNAValue }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasCurrentLatency'], 'Should display current latency label')
-        self.assertTrue(result['hasNAValue'], 'Should display N/A when no latency value')
+        html = self.html['no_latency']
+        self.assertIn('Current', html, 'Should display current latency label')
+        self.assertIn('N/A', html, 'Should display N/A when no latency value')
 
 
 class TestServiceCardLatencyWarning(unittest.TestCase):
     """Verify createServiceCard properly renders latency warning style."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.html = render_service_cards(WARNING_SERVICES)
+
     def test_service_card_with_latency_warning(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up',
-    latency_ms: 150,
-    average_latency_ms: 100,
-    latency_trend: 'warning'
-}};
-const html = createServiceCard(service);
-const hasWarningClass = html.includes('service-latency-warning');
-const hasWarningBadge = html.includes('service-latency-warning-badge') && html.includes('Latency elevated');
-console.log(JSON.stringify({{ hasWarningClass, hasWarningBadge }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
+        html = self.html['with_latency_warning']
+        self.assertIn('service-latency-warning', html, 'Should have service-latency-warning class when latency_trend is warning')
+        self.assertTrue(
+            'service-latency-warning-badge' in html and 'Latency elevated' in html,
+            'Should display Latency elevated badge when latency_trend is warning'
         )
 
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasWarningClass'], 'Should have service-latency-warning class when latency_trend is warning')
-        self.assertTrue(result['hasWarningBadge'], 'Should display Latency elevated badge when latency_trend is warning')
-
     def test_service_card_without_latency_warning(self):
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up',
-    latency_ms: 50,
-    average_latency_ms: 55,
-    latency_trend: 'stable'
-}};
-const html = createServiceCard(service);
-const hasWarningClass = html.includes('service-latency-warning');
-const hasWarningBadge = html.includes('Latency elevated');
-console.log(JSON.stringify({{ hasWarningClass, hasWarningBadge }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertFalse(result['hasWarningClass'], 'Should not have service-latency-warning class when latency_trend is not warning')
-        self.assertFalse(result['hasWarningBadge'], 'Should not display Latency elevated badge when latency_trend is not warning')
+        html = self.html['without_latency_warning']
+        self.assertNotIn('service-latency-warning', html, 'Should not have service-latency-warning class when latency_trend is not warning')
+        self.assertNotIn('Latency elevated', html, 'Should not display Latency elevated badge when latency_trend is not warning')
 
     def test_service_card_latency_warning_with_status_up(self):
         """Test that warning style is additive with status-up class."""
-        project_root = Path(__file__).resolve().parents[2]
-        service_view_path = project_root / 'frontend' / 'src' / 'views' / 'serviceView.js'
-
-        script = f"""
-import {{ createServiceCard }} from 'file://{service_view_path}';
-const service = {{
-    name: 'Test Service',
-    status: 'up',
-    latency_ms: 200,
-    latency_trend: 'warning'
-}};
-const html = createServiceCard(service);
-const hasStatusUpClass = html.includes('service-status-up');
-const hasWarningClass = html.includes('service-latency-warning');
-console.log(JSON.stringify({{ hasStatusUpClass, hasWarningClass }}));
-"""
-
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        result = json.loads(completed.stdout.strip())
-        self.assertTrue(result['hasStatusUpClass'], 'Should have service-status-up class')
-        self.assertTrue(result['hasWarningClass'], 'Should also have service-latency-warning class')
+        html = self.html['latency_warning_with_status_up']
+        self.assertIn('service-status-up', html, 'Should have service-status-up class')
+        self.assertIn('service-latency-warning', html, 'Should also have service-latency-warning class')
 
 
 if __name__ == '__main__':
@@ -1,8 +1,12 @@
 """Tests for tooltip formatting functions in job performance chart."""
-import json
-import subprocess
+import os
+import sys
 import unittest
-from pathlib import Path
+
+# Add project root to path so the shared helpers import when run directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tests.frontend_tests._node import PROJECT_ROOT, run_module
 
 
 class TestTooltipFormatting(unittest.TestCase):
@@ -11,20 +15,9 @@ class TestTooltipFormatting(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test fixtures that are shared across all tests."""
-        project_root = Path(__file__).resolve().parents[2]
-        cls.formatters_path = project_root / 'frontend' / 'src' / 'utils' / 'formatters.js'
-        cls.tooltip_path = project_root / 'frontend' / 'src' / 'utils' / 'tooltip.js'
+        cls.formatters_path = PROJECT_ROOT / 'frontend' / 'src' / 'utils' / 'formatters.js'
+        cls.tooltip_path = PROJECT_ROOT / 'frontend' / 'src' / 'utils' / 'tooltip.js'
 
-    def run_node_script(self, script):
-        """Helper to run Node.js script and return JSON output."""
-        completed = subprocess.run(
-            ['node', '--input-type=module', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return json.loads(completed.stdout.strip())
-    
     def test_format_timestamp_returns_readable_string(self):
         """Test that formatTimestamp converts ISO string to readable format."""
         script = f"""
@@ -34,7 +27,7 @@ const timestamp = '2024-01-20T10:30:00.000Z';
 const result = formatTimestamp(timestamp);
 console.log(JSON.stringify({{ formatted: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         formatted = result['formatted']
         
         # Should contain month, day, year, and time
@@ -51,7 +44,7 @@ import {{ formatTimestamp }} from 'file://{self.formatters_path}';
 const result = formatTimestamp(null);
 console.log(JSON.stringify({{ formatted: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         self.assertEqual(result['formatted'], '--')
     
     def test_format_timestamp_handles_undefined_value(self):
@@ -62,7 +55,7 @@ import {{ formatTimestamp }} from 'file://{self.formatters_path}';
 const result = formatTimestamp(undefined);
 console.log(JSON.stringify({{ formatted: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         self.assertEqual(result['formatted'], '--')
     
     def test_format_timestamp_handles_invalid_date_string(self):
@@ -73,7 +66,7 @@ import {{ formatTimestamp }} from 'file://{self.formatters_path}';
 const result = formatTimestamp('invalid-date-string');
 console.log(JSON.stringify({{ formatted: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         self.assertEqual(result['formatted'], '--')
     
     def test_format_duration_with_scale_seconds(self):
@@ -85,7 +78,7 @@ const scale = {{ unit: 's', label: 'seconds', divisor: 1 }};
 const result = formatDurationWithScale(245.5, scale);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIn('scaled', result)
         self.assertIn('raw', result)
@@ -104,7 +97,7 @@ const scale = {{ unit: 'min', label: 'minutes', divisor: 60 }};
 const result = formatDurationWithScale(300, scale);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIn('scaled', result)
         self.assertIn('raw', result)
@@ -124,7 +117,7 @@ const scale = {{ unit: 'hr', label: 'hours', divisor: 3600 }};
 const result = formatDurationWithScale(7200, scale);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIn('scaled', result)
         self.assertIn('raw', result)
@@ -144,7 +137,7 @@ const scale = {{ unit: 's', label: 'seconds', divisor: 1 }};
 const result = formatDurationWithScale(null, scale);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertEqual(result['scaled'], '--')
         self.assertEqual(result['raw'], '--')
@@ -158,7 +151,7 @@ const scale = {{ unit: 's', label: 'seconds', divisor: 1 }};
 const result = formatDurationWithScale(-10, scale);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertEqual(result['scaled'], '--')
         self.assertEqual(result['raw'], '--')
@@ -180,7 +173,7 @@ const scale = {{ unit: 's', label: 'seconds', divisor: 1 }};
 const result = buildTooltipContent(dataPoint, 'avg', 245, scale, 'frontend-app');
 console.log(JSON.stringify({{ html: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         html = result['html']
         
         # Should contain project name
@@ -210,7 +203,7 @@ const scale = {{ unit: 's', label: 'seconds', divisor: 1 }};
 const result = buildTooltipContent(dataPoint, 'p95', 350, scale);
 console.log(JSON.stringify({{ html: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         html = result['html']
         
         # Should contain placeholder for missing fields
@@ -236,7 +229,7 @@ const scale = {{ unit: 'min', label: 'minutes', divisor: 60 }};
 const result = buildTooltipContent(dataPoint, 'p99', 600, scale, 'backend-api');
 console.log(JSON.stringify({{ html: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         html = result['html']
         
         # Should contain project name
@@ -265,7 +258,7 @@ const points = [
 const result = findNearestPoint(150, 250, points, 20);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIsNotNone(result)
         self.assertEqual(result['dataPoint']['id'], 2)
@@ -285,7 +278,7 @@ const points = [
 const result = findNearestPoint(155, 255, points, 20);
 console.log(JSON.stringify(result));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIsNotNone(result)
         self.assertEqual(result['dataPoint']['id'], 2)
@@ -303,7 +296,7 @@ const points = [
 const result = findNearestPoint(500, 500, points, 20);
 console.log(JSON.stringify({{ result: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIsNone(result['result'])
     
@@ -315,7 +308,7 @@ import {{ findNearestPoint }} from 'file://{self.tooltip_path}';
 const result = findNearestPoint(100, 100, [], 20);
 console.log(JSON.stringify({{ result: result }}));
 """
-        result = self.run_node_script(script)
+        result = run_module(script)
         
         self.assertIsNone(result['result'])
 